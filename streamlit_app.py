@@ -1,13 +1,43 @@
+import io
+
 import streamlit as st
 import requests
 import xml.etree.ElementTree as ET
-from datetime import datetime, timedelta
+try:
+    # libxml2's C parser; noticeably faster than stdlib ElementTree.
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+import functools
+import operator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 import re
-from bs4 import BeautifulSoup
+try:
+    # C parser for ISO-8601 dates; much faster than strptime.
+    import ciso8601
+except ImportError:
+    ciso8601 = None
+from bs4 import BeautifulSoup, SoupStrainer
 from urllib.parse import urljoin
 
 SEBI_FEED_URL = "https://www.sebi.gov.in/sebirss.xml"
 
+# All fetches hit sebi.gov.in; a shared pooled session keeps connections
+# alive so each request doesn't pay a fresh TCP + TLS handshake. Sized
+# to cover the PDF-prefetch worker threads.
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=16),
+)
+
+# Only iframe tags are ever looked at, so skip building the rest of the
+# page; lxml's C parser is much faster than html.parser when available.
+_HTML_PARSER = "lxml" if lxml_etree is not None else "html.parser"
+_IFRAME_ONLY = SoupStrainer("iframe", src=True)
+
 KEYWORDS = [
     "circular",
     "master circular",
@@ -17,82 +47,139 @@ KEYWORDS = [
     "amendments",
 ]
 
-def fetch_sebi_feed(url):
-    resp = requests.get(url)
+KEYWORDS_LC = tuple(word.casefold() for word in KEYWORDS)
+
+# Compiled once at import; one scan covers all keywords instead of one
+# re.search per keyword per call.
+KEYWORD_RE = re.compile(
+    r"\b(?:{})\b".format("|".join(re.escape(word) for word in KEYWORDS)),
+    re.IGNORECASE,
+)
+
+@st.cache_data(ttl=600)
+def load_sebi_items(url):
+    # Stream the response body straight into the XML parser instead of
+    # buffering it in one bytes object; parsing overlaps the download
+    # and the picklable item list is what gets cached.
+    resp = SESSION.get(url, stream=True, timeout=10)
     resp.raise_for_status()
-    return resp.content
+    resp.raw.decode_content = True
+    return parse_sebi_feed(resp.raw)
 
-def parse_sebi_feed(xml_content):
-    root = ET.fromstring(xml_content)
+def parse_sebi_feed(xml_source):
+    # Stream <item> elements instead of building the whole tree, and
+    # clear each one after reading it to keep peak memory bounded.
+    # Accepts raw bytes or any file-like object.
+    source = io.BytesIO(xml_source) if isinstance(xml_source, bytes) else xml_source
+    if lxml_etree is not None:
+        context = lxml_etree.iterparse(source, tag="item")
+    else:
+        context = (
+            (event, elem)
+            for event, elem in ET.iterparse(source)
+            if elem.tag == "item"
+        )
     items = []
-    for item in root.findall("./channel/item"):
-        title = item.findtext("title", default="")
-        link = item.findtext("link", default="")
-        pub_date = item.findtext("pubDate", default="")
-        description = item.findtext("description", default="")
+    for _, item in context:
         items.append({
-            "title": title,
-            "link": link,
-            "pub_date": pub_date,
-            "description": description,
+            "title": item.findtext("title", default=""),
+            "link": item.findtext("link", default=""),
+            "pub_date": item.findtext("pubDate", default=""),
+            "description": item.findtext("description", default=""),
         })
+        item.clear()
     return items
 
 def is_keyword_present(text):
-    text_lower = text.lower()
-    return any(re.search(r"\b{}\b".format(re.escape(word)), text_lower) for word in KEYWORDS)
+    # Plain substring scan first: str.__contains__ runs in C and decides
+    # the common no-match case without touching the regex engine. Only
+    # substring hits fall through to the regex, which confirms word
+    # boundaries (so e.g. "deregulation" doesn't count).
+    t = text.casefold()
+    if not any(word in t for word in KEYWORDS_LC):
+        return False
+    return KEYWORD_RE.search(t) is not None
+
+def _to_utc(dt):
+    # Dates without an offset are taken as UTC rather than local time.
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
 
+@functools.lru_cache(maxsize=4096)
 def parse_pub_date(pub_date):
-    # Try multiple date formats
+    # Feeds repeat identical pubDate strings and Streamlit reruns
+    # re-filter the same items, so parse each distinct string only once.
+    # Always returns a tz-aware UTC datetime.
+    # RSS pubDate is RFC-2822 by spec, so the dedicated parser handles
+    # the common case without trying format strings one by one.
+    try:
+        return _to_utc(parsedate_to_datetime(pub_date))
+    except (TypeError, ValueError):
+        pass
+    if ciso8601 is not None:
+        try:
+            return _to_utc(ciso8601.parse_datetime(pub_date))
+        except ValueError:
+            pass
+    # Fall back to the other formats SEBI has used
     fmts = [
-        "%a, %d %b %Y %H:%M:%S %z",
-        "%a, %d %b %Y %H:%M:%S %z",
         "%d %b, %Y %z",
         "%d %b, %Y",
         "%Y-%m-%d"
     ]
     for fmt in fmts:
         try:
-            return datetime.strptime(pub_date, fmt)
+            return _to_utc(datetime.strptime(pub_date, fmt))
         except Exception:
             continue
     try:
         # Remove timezone if present and try again
-        return datetime.strptime(pub_date.split("+")[0].strip(), "%d %b, %Y")
+        return _to_utc(datetime.strptime(pub_date.split("+")[0].strip(), "%d %b, %Y"))
     except Exception:
         pass
     return None
 
+@st.cache_data(ttl=600)
 def filter_items(items, weeks=3):
+    # Cached for 10 minutes, so the date cutoff can lag by at most that.
     filtered = []
-    now = datetime.utcnow()
+    now = datetime.now(timezone.utc)
     start_date = now - timedelta(weeks=weeks)
     for item in items:
+        # Cheap keyword check first; only parse dates for candidates.
+        # NUL never appears in feed text and is a word boundary, so one
+        # scan covers both fields without a spurious cross-field match.
+        if not is_keyword_present(item["title"] + "\x00" + item["description"]):
+            continue
         dt = parse_pub_date(item["pub_date"])
         if not dt:
             continue
-        # Convert tz-aware to naive UTC if necessary
-        if dt.tzinfo:
-            dt = dt.astimezone(tz=None).replace(tzinfo=None)
         if dt < start_date:
             continue
-        if is_keyword_present(item["title"]) or is_keyword_present(item["description"]):
-            item_cpy = item.copy()
-            item_cpy["pub_date_obj"] = dt
-            filtered.append(item_cpy)
+        item["pub_date_obj"] = dt
+        # Float timestamps compare in C, unlike datetime objects.
+        item["pub_ts"] = dt.timestamp()
+        # Format once here; the render loop and the table both reuse
+        # these on every rerun.
+        item["pub_display"] = dt.strftime("%d %b %Y, %H:%M:%S")
+        item["pub_table"] = dt.strftime("%d-%m-%Y %H:%M")
+        filtered.append(item)
     # Sort by date, latest first
-    filtered.sort(key=lambda x: x["pub_date_obj"], reverse=True)
+    filtered.sort(key=operator.itemgetter("pub_ts"), reverse=True)
     return filtered
 
+@st.cache_data(ttl=3600)
 def extract_pdf_from_iframe(page_url):
     """
     Given a SEBI webpage URL, extract the first PDF URL from an <iframe> if present.
     Returns the PDF URL as a string, or None if not found.
+    Results are cached for an hour so reruns don't re-fetch the page.
     """
     try:
-        response = requests.get(page_url, timeout=10)
+        response = SESSION.get(page_url, timeout=10)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = BeautifulSoup(response.text, _HTML_PARSER, parse_only=_IFRAME_ONLY)
         iframe = soup.find("iframe", src=True)
         if iframe:
             pdf_url = iframe["src"]
@@ -108,8 +195,7 @@ def main():
     st.write("Latest updates from SEBI for circulars, master circulars, regulations and amendments, including PDF extraction if available (last 3 weeks).")
     with st.spinner("Fetching SEBI RSS feed..."):
         try:
-            xml_content = fetch_sebi_feed(SEBI_FEED_URL)
-            items = parse_sebi_feed(xml_content)
+            items = load_sebi_items(SEBI_FEED_URL)
             filtered = filter_items(items, weeks=3)
         except Exception as e:
             st.error(f"Failed to fetch or parse SEBI feed: {e}")
@@ -119,13 +205,21 @@ def main():
         st.info("No relevant SEBI circulars, master circulars, or regulation/amendment updates found in the last 3 weeks.")
         return
 
+    # The per-item page fetches are independent and I/O-bound, so run
+    # them concurrently instead of one per loop iteration.
+    with st.spinner("Checking for PDFs..."):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            pdf_urls = list(executor.map(
+                extract_pdf_from_iframe, [item["link"] for item in filtered]
+            ))
+    for item, pdf_url in zip(filtered, pdf_urls):
+        item["pdf_url"] = pdf_url
+
     for idx, item in enumerate(filtered, 1):
         st.markdown(f"### {idx}. [{item['title']}]({item['link']})")
-        st.write(f"**Published:** {item['pub_date_obj'].strftime('%d %b %Y, %H:%M:%S')}")
+        st.write(f"**Published:** {item['pub_display']}")
         st.write(item['description'])
-        # PDF extraction
-        with st.spinner("Checking for PDF..."):
-            pdf_url = extract_pdf_from_iframe(item["link"])
+        pdf_url = item["pdf_url"]
         if pdf_url and pdf_url.lower().endswith(".pdf"):
             st.markdown(f"[🔗 Download/View PDF]({pdf_url})")
             st.components.v1.iframe(pdf_url, height=600)
@@ -136,14 +230,14 @@ def main():
     # Option to view as table
     with st.expander("Show as table"):
         import pandas as pd
-        df = pd.DataFrame([
-            {
-                "Title": item["title"],
-                "Published": item["pub_date_obj"].strftime("%d-%m-%Y %H:%M"),
-                "Link": item["link"],
-                "PDF": extract_pdf_from_iframe(item["link"]) or "Not found"
-            } for item in filtered
-        ])
+        # Column-major construction skips pandas' row-by-row dict
+        # handling and dtype inference.
+        df = pd.DataFrame({
+            "Title": [item["title"] for item in filtered],
+            "Published": [item["pub_table"] for item in filtered],
+            "Link": [item["link"] for item in filtered],
+            "PDF": [url or "Not found" for url in pdf_urls],
+        })
         st.dataframe(df)
 
 if __name__ == "__main__":